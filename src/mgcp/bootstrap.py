@@ -14,9 +14,9 @@ Usage:
 
 import asyncio
 
-from .bootstrap_loader import load_lessons, load_relationships, load_workflows
+from .bootstrap_loader import load_all, load_lessons
 from .graph import LessonGraph
-from .models import Relationship
+from .models import Lesson, Relationship
 from .persistence import LessonStore
 from .qdrant_vector_store import QdrantVectorStore
 
@@ -77,9 +77,19 @@ async def seed_relationships(relationships: list, store: LessonStore, graph: Les
     added = 0
     skipped = 0
 
+    # Hub lessons sit on dozens of edges. Fetch each endpoint from the store
+    # once and keep mutating that copy - every change is written back with
+    # update_lesson, so the cached object never drifts from the database.
+    lessons_by_id: dict[str, Lesson | None] = {}
+
+    async def get_lesson(lesson_id: str) -> Lesson | None:
+        if lesson_id not in lessons_by_id:
+            lessons_by_id[lesson_id] = await store.get_lesson(lesson_id)
+        return lessons_by_id[lesson_id]
+
     for source_id, target_id, rel_type, context in relationships:
-        source = await store.get_lesson(source_id)
-        target = await store.get_lesson(target_id)
+        source = await get_lesson(source_id)
+        target = await get_lesson(target_id)
 
         if not source or not target:
             print(f"  Skipping {source_id} -> {target_id} (lesson not found)")
@@ -182,16 +192,13 @@ async def seed_database(core_only: bool = False, dev_only: bool = False) -> None
     workflows_to_seed = []
 
     if not dev_only:
-        core_lessons = load_lessons("core")
-        core_rels = load_relationships("core")
+        core_lessons, core_rels, _ = load_all("core")
         lessons_to_seed.extend(core_lessons)
         relationships_to_seed.extend(core_rels)
         print(f"Core: {len(core_lessons)} lessons, {len(core_rels)} relationships")
 
     if not core_only:
-        dev_lessons = load_lessons("dev")
-        dev_rels = load_relationships("dev")
-        dev_workflows = load_workflows("dev")
+        dev_lessons, dev_rels, dev_workflows = load_all("dev")
         lessons_to_seed.extend(dev_lessons)
         relationships_to_seed.extend(dev_rels)
         workflows_to_seed.extend(dev_workflows)
@@ -272,11 +279,8 @@ Bootstrap Modules:
             print("mgcp-bootstrap 1.1.0")
             return
         elif sys.argv[1] == "--list":
-            core_lessons = load_lessons("core")
-            core_rels = load_relationships("core")
-            dev_lessons = load_lessons("dev")
-            dev_rels = load_relationships("dev")
-            dev_workflows = load_workflows("dev")
+            core_lessons, core_rels, _ = load_all("core")
+            dev_lessons, dev_rels, dev_workflows = load_all("dev")
             print(f"""Available Bootstrap Modules:
 
 CORE (bootstrap_data/core/):
@@ -18,7 +18,9 @@ Directory structure:
         └── workflows.yaml
 """
 
+from functools import cache
 from pathlib import Path
+from typing import Literal
 
 import yaml
 
@@ -26,16 +28,24 @@ from .models import Example, Lesson, Workflow, WorkflowStep, WorkflowStepLesson
 
 BOOTSTRAP_DIR = Path(__file__).parent / "bootstrap_data"
 
+# libyaml's C loader parses the bootstrap tree ~10x faster than the pure-Python
+# one. PyYAML wheels ship it on all major platforms; fall back when it's absent.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _SafeLoader
+
 
 def _parse_lesson(data: dict) -> Lesson:
     """Parse a lesson dict from YAML into a Lesson model."""
-    examples = []
-    for ex in data.get("examples", []):
-        examples.append(Example(
+    examples = [
+        Example(
             label=ex["label"],
             code=ex["code"],
             explanation=ex.get("explanation"),
-        ))
+        )
+        for ex in data.get("examples", [])
+    ]
 
     return Lesson(
         id=data["id"],
@@ -52,13 +62,16 @@ def _parse_workflow(data: dict) -> Workflow:
     """Parse a workflow dict from YAML into a Workflow model."""
     steps = []
     for step_data in data.get("steps", []):
-        lessons = []
-        for lesson_data in step_data.get("lessons", []):
-            lessons.append(WorkflowStepLesson(
+        lessons = [
+            WorkflowStepLesson(
                 lesson_id=lesson_data["lesson_id"],
                 relevance=lesson_data["relevance"],
                 priority=lesson_data.get("priority", 2),
-            ))
+            )
+            for lesson_data in step_data.get("lessons", [])
+        ]
+        # Store links in priority order (stable, so authoring order breaks ties)
+        lessons.sort(key=lambda link: link.priority)
 
         steps.append(WorkflowStep(
             id=step_data["id"],
@@ -83,8 +96,9 @@ def _parse_workflow(data: dict) -> Workflow:
 
 def _load_yaml_file(path: Path) -> dict:
     """Load and parse a single YAML file."""
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    # Binary mode: the loader detects and decodes UTF-8 itself
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_SafeLoader) or {}
 
 
 def _collect_yaml_files(directory: Path, pattern: str = "*.yaml") -> list[Path]:
@@ -94,38 +108,72 @@ def _collect_yaml_files(directory: Path, pattern: str = "*.yaml") -> list[Path]:
     return sorted(directory.rglob(pattern))
 
 
-def _is_relationship_file(path: Path) -> bool:
-    """Check if a YAML file contains relationship data (not lessons)."""
-    return "relationships" in path.stem
+def _classify(path: Path) -> Literal["lessons", "relationships", "workflows"]:
+    """Decide which kind of bootstrap data a YAML file holds, from its name alone."""
+    if "relationships" in path.stem:
+        return "relationships"
+    if path.stem == "workflows":
+        return "workflows"
+    return "lessons"
 
 
-def _is_workflow_file(path: Path) -> bool:
-    """Check if a YAML file contains workflow data (not lessons)."""
-    return path.stem == "workflows"
+@cache
+def _load_tree(base: Path) -> tuple[tuple[Path, dict], ...]:
+    """Parse every YAML file under base, once per process.
 
+    Bootstrap data ships with the package and does not change at runtime, so
+    the parsed documents are memoised. Callers must treat them as read-only;
+    load_all builds fresh models from them on every call.
+    """
+    return tuple((path, _load_yaml_file(path)) for path in _collect_yaml_files(base))
 
-def load_lessons(subdir: str | None = None) -> list[Lesson]:
-    """Load lessons from YAML files in bootstrap_data/.
+
+def load_all(subdir: str | None = None) -> tuple[list[Lesson], list[tuple], list[Workflow]]:
+    """Load lessons, relationships and workflows in a single pass over bootstrap_data/.
+
+    Each YAML file is found and parsed once, then dispatched by its name.
+    Parsed YAML is cached per directory; the returned lists and models are
+    new on every call, so callers may mutate them freely.
 
     Args:
         subdir: Optional subdirectory to load from (e.g., "core", "dev").
                 If None, loads from all subdirectories.
 
     Returns:
-        List of Lesson objects parsed from YAML files.
+        (lessons, relationships, workflows) where relationships are
+        (source_id, target_id, rel_type, context) tuples.
     """
     lessons = []
+    relationships = []
+    workflows = []
     base = BOOTSTRAP_DIR / subdir if subdir else BOOTSTRAP_DIR
 
-    for yaml_path in _collect_yaml_files(base):
-        if _is_relationship_file(yaml_path) or _is_workflow_file(yaml_path):
-            continue
+    for yaml_path, data in _load_tree(base):
+        kind = _classify(yaml_path)
+        if kind == "relationships":
+            relationships.extend(
+                (rel["source"], rel["target"], rel["type"], rel.get("context", ""))
+                for rel in data.get("relationships", [])
+            )
+        elif kind == "workflows":
+            workflows.extend(_parse_workflow(wf_data) for wf_data in data.get("workflows", []))
+        else:
+            lessons.extend(_parse_lesson(lesson_data) for lesson_data in data.get("lessons", []))
+
+    return lessons, relationships, workflows
+
 
-        data = _load_yaml_file(yaml_path)
-        for lesson_data in data.get("lessons", []):
-            lessons.append(_parse_lesson(lesson_data))
+def load_lessons(subdir: str | None = None) -> list[Lesson]:
+    """Load lessons from YAML files in bootstrap_data/.
+
+    Args:
+        subdir: Optional subdirectory to load from (e.g., "core", "dev").
+                If None, loads from all subdirectories.
 
-    return lessons
+    Returns:
+        List of Lesson objects parsed from YAML files.
+    """
+    return load_all(subdir)[0]
 
 
 def load_relationships(subdir: str | None = None) -> list[tuple]:
@@ -138,23 +186,7 @@ def load_relationships(subdir: str | None = None) -> list[tuple]:
     Returns:
         List of (source_id, target_id, rel_type, context) tuples.
     """
-    relationships = []
-    base = BOOTSTRAP_DIR / subdir if subdir else BOOTSTRAP_DIR
-
-    for yaml_path in _collect_yaml_files(base):
-        if not _is_relationship_file(yaml_path):
-            continue
-
-        data = _load_yaml_file(yaml_path)
-        for rel in data.get("relationships", []):
-            relationships.append((
-                rel["source"],
-                rel["target"],
-                rel["type"],
-                rel.get("context", ""),
-            ))
-
-    return relationships
+    return load_all(subdir)[1]
 
 
 def load_workflows(subdir: str | None = None) -> list[Workflow]:
@@ -167,15 +199,35 @@ def load_workflows(subdir: str | None = None) -> list[Workflow]:
     Returns:
         List of Workflow objects parsed from YAML files.
     """
-    workflows = []
-    base = BOOTSTRAP_DIR / subdir if subdir else BOOTSTRAP_DIR
+    return load_all(subdir)[2]
 
-    for yaml_path in _collect_yaml_files(base):
-        if yaml_path.name != "workflows.yaml":
-            continue
 
-        data = _load_yaml_file(yaml_path)
-        for wf_data in data.get("workflows", []):
-            workflows.append(_parse_workflow(wf_data))
+def find_dangling_references(
+    lessons: list[Lesson], relationships: list[tuple], workflows: list[Workflow]
+) -> list[str]:
+    """Report lesson ids that bootstrap data points at but never defines.
 
-    return workflows
+    Checks relationship endpoints, parent_id links and workflow step lessons
+    against a single set of known ids.
+
+    Returns:
+        Human-readable problems; empty when every reference resolves.
+    """
+    known = {lesson.id for lesson in lessons}
+    problems = [
+        f"lesson {lesson.id}: unknown parent_id {lesson.parent_id}"
+        for lesson in lessons
+        if lesson.parent_id and lesson.parent_id not in known
+    ]
+    for source, target, rel_type, _ in relationships:
+        for endpoint in (source, target):
+            if endpoint not in known:
+                problems.append(f"relationship {source} --[{rel_type}]--> {target}: unknown lesson {endpoint}")
+    problems.extend(
+        f"workflow {wf.id} step {step.id}: unknown lesson {link.lesson_id}"
+        for wf in workflows
+        for step in wf.steps
+        for link in step.lessons
+        if link.lesson_id not in known
+    )
+    return problems
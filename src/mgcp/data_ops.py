@@ -9,11 +9,27 @@ from pathlib import Path
 
 from .models import Lesson
 from .persistence import LessonStore
-from .qdrant_vector_store import QdrantVectorStore
+
+# QdrantVectorStore is imported inside the functions that use it, so
+# mgcp-export doesn't load qdrant_client (~1s) just to dump SQLite rows.
 
 logger = logging.getLogger("mgcp.data_ops")
 
 
+def _write_json(data: dict, output_path: Path | None, **kwargs) -> None:
+    """Stream indented JSON to output_path, or to stdout when it is None.
+
+    json.dump writes encoder chunks straight to the handle, so the full
+    document is never held in memory as a second, serialised copy.
+    """
+    if output_path:
+        with output_path.open("w") as f:
+            json.dump(data, f, indent=2, **kwargs)
+    else:
+        json.dump(data, sys.stdout, indent=2, **kwargs)
+        sys.stdout.write("\n")
+
+
 async def export_lessons(output_path: Path | None = None, include_usage: bool = True) -> dict:
     """
     Export all lessons to JSON format.
@@ -55,12 +71,10 @@ async def export_lessons(output_path: Path | None = None, include_usage: bool =
 
         export_data["lessons"].append(lesson_dict)
 
+    _write_json(export_data, output_path)
     if output_path:
-        output_path.write_text(json.dumps(export_data, indent=2))
         return {"status": "success", "path": str(output_path), "count": len(lessons)}
-    else:
-        print(json.dumps(export_data, indent=2))
-        return {"status": "success", "count": len(lessons)}
+    return {"status": "success", "count": len(lessons)}
 
 
 async def import_lessons(
@@ -79,6 +93,8 @@ async def import_lessons(
     Returns:
         Dict with import results
     """
+    from .qdrant_vector_store import QdrantVectorStore
+
     store = LessonStore()
     vector_store = QdrantVectorStore()
 
@@ -114,18 +130,22 @@ async def import_lessons(
         "dry_run": dry_run
     }
 
+    # Indexed together after the loop: one embedding batch, one upsert
+    pending: list[Lesson] = []
+
     for lesson_data in lessons_data:
         try:
             lesson_id = lesson_data.get("id", "unknown")
-            trigger = lesson_data.get("trigger", "")
 
             # Validate required fields
             if not lesson_data.get("id") or not lesson_data.get("trigger") or not lesson_data.get("action"):
                 results["errors"].append(f"Lesson {lesson_id}: missing required fields (id, trigger, action)")
                 continue
+            trigger_lower = lesson_data["trigger"].lower()
+
             # Check for duplicates
             is_duplicate_id = lesson_id in existing_ids
-            is_duplicate_trigger = trigger.lower() in existing_triggers
+            is_duplicate_trigger = trigger_lower in existing_triggers
 
             if is_duplicate_id or is_duplicate_trigger:
                 if merge_strategy == "skip":
@@ -137,7 +157,7 @@ async def import_lessons(
                         if is_duplicate_id:
                             await store.delete_lesson(lesson_id)
                         elif is_duplicate_trigger:
-                            await store.delete_lesson(existing_triggers[trigger.lower()])
+                            await store.delete_lesson(existing_triggers[trigger_lower])
                     results["overwritten"] += 1
                 elif merge_strategy == "rename":
                     # Generate new ID
@@ -176,15 +196,19 @@ async def import_lessons(
 
                 # Save to store
                 await store.add_lesson(lesson)
-
-                # Add to vector store
-                vector_store.add_lesson(lesson)
+                pending.append(lesson)
 
             results["imported"] += 1
 
         except Exception as e:
             results["errors"].append(f"Failed to import {lesson_id}: {e}")
 
+    # Add to vector store
+    try:
+        vector_store.add_lessons(pending)
+    except Exception as e:
+        results["errors"].append(f"Failed to index {len(pending)} imported lessons: {e}")
+
     return results
 
 
@@ -212,12 +236,10 @@ async def export_projects(output_path: Path | None = None) -> dict:
             "catalogue": ctx.catalogue.model_dump() if ctx.catalogue else {},
         })
 
+    _write_json(export_data, output_path, default=str)
     if output_path:
-        output_path.write_text(json.dumps(export_data, indent=2, default=str))
         return {"status": "success", "path": str(output_path), "count": len(contexts)}
-    else:
-        print(json.dumps(export_data, indent=2, default=str))
-        return {"status": "success", "count": len(contexts)}
+    return {"status": "success", "count": len(contexts)}
 
 
 async def find_duplicates(threshold: float = 0.85) -> list[dict]:
@@ -230,6 +252,8 @@ async def find_duplicates(threshold: float = 0.85) -> list[dict]:
     Returns:
         List of duplicate pairs with similarity scores
     """
+    from .qdrant_vector_store import QdrantVectorStore
+
     store = LessonStore()
     vector_store = QdrantVectorStore()
 
@@ -237,19 +261,20 @@ async def find_duplicates(threshold: float = 0.85) -> list[dict]:
     lessons_by_id = {l.id: l for l in lessons}
     duplicates = []
 
+    # Search for lessons similar to each one (lists of (id, score) tuples).
+    # All queries go out as one embedding batch and one Qdrant request.
+    all_similar = vector_store.search_batch(
+        [f"{lesson.trigger} {lesson.action}" for lesson in lessons],
+        limit=5,
+        min_score=threshold
+    )
+
     # Compare each lesson against others
     checked = set()
-    for lesson in lessons:
+    for lesson, similar in zip(lessons, all_similar):
         if lesson.id in checked:
             continue
 
-        # Search for similar lessons (returns list of (id, score) tuples)
-        similar = vector_store.search(
-            f"{lesson.trigger} {lesson.action}",
-            limit=5,
-            min_score=threshold
-        )
-
         for match_id, score in similar:
             if match_id == lesson.id:
                 continue
@@ -287,6 +312,8 @@ async def suggest_tags(lesson_id: str, max_tags: int = 5) -> list[str]:
     Returns:
         List of suggested tags
     """
+    from .qdrant_vector_store import QdrantVectorStore
+
     store = LessonStore()
     vector_store = QdrantVectorStore()
 
@@ -300,12 +327,15 @@ async def suggest_tags(lesson_id: str, max_tags: int = 5) -> list[str]:
         limit=10
     )
 
-    # Collect tags from similar lessons
+    # Collect tags from similar lessons, fetched in a single query
+    similar_lessons = await store.get_lessons_by_ids(
+        [match_id for match_id, _ in similar if match_id != lesson_id]
+    )
     tag_counts = {}
     for match_id, score in similar:
         if match_id == lesson_id:
             continue
-        similar_lesson = await store.get_lesson(match_id)
+        similar_lesson = similar_lessons.get(match_id)
         if similar_lesson:
             for tag in similar_lesson.tags:
                 # Weight by similarity
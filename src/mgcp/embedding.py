@@ -17,6 +17,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import numpy as np
     from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger("mgcp.embedding")
@@ -29,6 +30,12 @@ EMBEDDING_DIMENSION = 768
 # See: https://huggingface.co/BAAI/bge-base-en-v1.5#usage
 QUERY_INSTRUCTION = "Represent this sentence for searching relevant passages: "
 
+# Default encode() batch sizes. On CPU, smaller batches waste less work padding
+# short texts to the longest one in the batch; GPUs want larger batches to
+# stay busy.
+CPU_BATCH_SIZE = 16
+GPU_BATCH_SIZE = 64
+
 
 @lru_cache(maxsize=1)
 def get_embedding_model() -> SentenceTransformer:
@@ -71,22 +78,49 @@ def embed_query(text: str) -> list[float]:
     an instruction string. This must only be used for queries, not for
     documents/passages being stored.
 
+    Hooks and agents re-issue the same queries constantly, so the encoder's
+    float32 arrays are memoised (read-only, ~3KB each); callers get a fresh
+    list each time.
+
     Args:
         text: Query text to embed
 
     Returns:
         List of floats representing the embedding vector (768 dimensions)
     """
+    return _embed_query_cached(text).tolist()
+
+
+@lru_cache(maxsize=1024)
+def _embed_query_cached(text: str) -> np.ndarray:
     model = get_embedding_model()
     embedding = model.encode(QUERY_INSTRUCTION + text, normalize_embeddings=True)
-    return embedding.tolist()
+    embedding.flags.writeable = False
+    return embedding
+
+
+def embed_query_batch(texts: list[str]) -> list[list[float]]:
+    """Embed several queries in one batch, with the BGE instruction prefix.
+
+    The batched counterpart of embed_query, for callers that run many searches
+    at once. Results are not memoised.
+
+    Args:
+        texts: Query texts to embed
+
+    Returns:
+        List of embedding vectors
+    """
+    return embed_batch([QUERY_INSTRUCTION + text for text in texts])
 
 
-def embed_batch(texts: list[str]) -> list[list[float]]:
+def embed_batch(texts: list[str], batch_size: int | None = None) -> list[list[float]]:
     """Embed multiple texts efficiently.
 
     Args:
         texts: List of texts to embed
+        batch_size: Texts per forward pass. Defaults to CPU_BATCH_SIZE, or
+            GPU_BATCH_SIZE when the model runs on CUDA.
 
     Returns:
         List of embedding vectors
@@ -95,5 +129,9 @@ def embed_batch(texts: list[str]) -> list[list[float]]:
         return []
 
     model = get_embedding_model()
-    embeddings = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+    if batch_size is None:
+        batch_size = GPU_BATCH_SIZE if model.device.type == "cuda" else CPU_BATCH_SIZE
+    embeddings = model.encode(
+        texts, batch_size=batch_size, normalize_embeddings=True, show_progress_bar=False
+    )
     return [emb.tolist() for emb in embeddings]
@@ -142,8 +142,10 @@ class LessonGraph:
             visited.add(node_id)
             current_path = current_path + [node_id]
 
+            # current_path is already a fresh list and is never mutated, so
+            # the recorded path can share it instead of copying again.
             if len(current_path) > 1:
-                paths.append(current_path.copy())
+                paths.append(current_path)
 
             # Traverse children (parent relation)
             for child_id in self.get_children(node_id):
@@ -193,6 +195,29 @@ class LessonGraph:
         """Get depth of a lesson in the hierarchy (0 for root)."""
         return len(self.get_ancestors(lesson_id))
 
+    def _hierarchy_depths(self) -> dict[str, int]:
+        """Get the hierarchy depth of every node, walking each parent chain once.
+
+        Calling get_hierarchy_depth per node re-walks the shared upper part of
+        every chain, so whole-graph callers use this instead.
+        """
+        depths: dict[str, int] = {}
+        for node_id in self.graph.nodes():
+            chain = []
+            current = node_id
+            while current not in depths:
+                parent = self.get_parent(current)
+                if parent is None:
+                    depths[current] = 0
+                    break
+                chain.append(current)
+                current = parent
+            depth = depths[current]
+            for chained_id in reversed(chain):
+                depth += 1
+                depths[chained_id] = depth
+        return depths
+
     def find_path(self, from_id: str, to_id: str) -> list[str] | None:
         """Find shortest path between two lessons."""
         try:
@@ -209,15 +234,13 @@ class LessonGraph:
             "total_nodes": self.graph.number_of_nodes(),
             "total_edges": self.graph.number_of_edges(),
             "root_count": len(self.get_roots()),
-            "max_depth": max(
-                (self.get_hierarchy_depth(n) for n in self.graph.nodes()),
-                default=0,
-            ),
+            "max_depth": max(self._hierarchy_depths().values(), default=0),
             "connected_components": nx.number_weakly_connected_components(self.graph),
         }
 
     def to_dict(self) -> dict:
         """Export graph as dictionary for visualization."""
+        depths = self._hierarchy_depths()
         nodes = []
         for node_id in self.graph.nodes():
             data = self.graph.nodes[node_id]
@@ -227,7 +250,7 @@ class LessonGraph:
                 "action": data.get("action", ""),
                 "tags": data.get("tags", []),
                 "usage_count": data.get("usage_count", 0),
-                "depth": self.get_hierarchy_depth(node_id),
+                "depth": depths[node_id],
             })
 
         links = []
@@ -490,6 +490,18 @@ class LessonStore:
             rows = await cursor.fetchall()
             return [self._row_to_lesson(row) for row in rows]
 
+    async def get_lessons_by_ids(self, lesson_ids: list[str]) -> dict[str, Lesson]:
+        """Get several lessons in one query, keyed by ID. Unknown IDs are omitted."""
+        if not lesson_ids:
+            return {}
+        async with self._connection() as conn:
+            placeholders = ",".join("?" for _ in lesson_ids)
+            cursor = await conn.execute(
+                f"SELECT * FROM lessons WHERE id IN ({placeholders})", lesson_ids
+            )
+            rows = await cursor.fetchall()
+            return {row["id"]: self._row_to_lesson(row) for row in rows}
+
     async def get_lessons_by_parent(self, parent_id: str | None) -> list[Lesson]:
         """Get lessons with a specific parent (None for root lessons)."""
         async with self._connection() as conn:
@@ -24,13 +24,14 @@ from qdrant_client.models import (
     Distance,
     FieldCondition,
     Filter,
+    FilterSelector,
     MatchAny,
     MatchValue,
     PointStruct,
     VectorParams,
 )
 
-from .embedding import EMBEDDING_DIMENSION, embed, embed_query
+from .embedding import EMBEDDING_DIMENSION, embed_batch, embed_query
 from .models import (
     ArchitecturalNote,
     Convention,
@@ -64,6 +65,9 @@ def get_default_qdrant_path() -> str:
 
 DEFAULT_QDRANT_PATH = get_default_qdrant_path()
 
+# Points sent per Qdrant upsert when indexing a whole catalogue
+UPSERT_BATCH_SIZE = 256
+
 ItemType = Literal[
     "arch", "security", "framework", "library", "tool",
     "convention", "coupling", "decision", "error"
@@ -122,65 +126,33 @@ class QdrantCatalogueStore:
 
     def index_catalogue(self, project_id: str, catalogue: ProjectCatalogue) -> int:
         """Index all items from a project catalogue. Returns count of items indexed."""
-        count = 0
-
-        # Index architectural notes
-        for note in catalogue.architecture_notes:
-            self._add_arch_note(project_id, note)
-            count += 1
-
-        # Index security notes
-        for note in catalogue.security_notes:
-            self._add_security_note(project_id, note)
-            count += 1
-
-        # Index dependencies
-        for dep in catalogue.frameworks:
-            self._add_dependency(project_id, dep, "framework")
-            count += 1
-        for dep in catalogue.libraries:
-            self._add_dependency(project_id, dep, "library")
-            count += 1
-        for dep in catalogue.tools:
-            self._add_dependency(project_id, dep, "tool")
-            count += 1
-
-        # Index conventions
-        for conv in catalogue.conventions:
-            self._add_convention(project_id, conv)
-            count += 1
-
-        # Index file couplings
-        for coupling in catalogue.file_couplings:
-            self._add_file_coupling(project_id, coupling)
-            count += 1
-
-        # Index decisions
-        for dec in catalogue.decisions:
-            self._add_decision(project_id, dec)
-            count += 1
-
-        # Index error patterns
-        for err in catalogue.error_patterns:
-            self._add_error_pattern(project_id, err)
-            count += 1
-
-        # Index custom items
-        for item in catalogue.custom_items:
-            self._add_custom_item(project_id, item)
-            count += 1
-
-        return count
+        items = [
+            *(self._build_arch_note(project_id, note) for note in catalogue.architecture_notes),
+            *(self._build_security_note(project_id, note) for note in catalogue.security_notes),
+            *(self._build_dependency(project_id, dep, "framework") for dep in catalogue.frameworks),
+            *(self._build_dependency(project_id, dep, "library") for dep in catalogue.libraries),
+            *(self._build_dependency(project_id, dep, "tool") for dep in catalogue.tools),
+            *(self._build_convention(project_id, conv) for conv in catalogue.conventions),
+            *(self._build_file_coupling(project_id, c) for c in catalogue.file_couplings),
+            *(self._build_decision(project_id, dec) for dec in catalogue.decisions),
+            *(self._build_error_pattern(project_id, err) for err in catalogue.error_patterns),
+            *(self._build_custom_item(project_id, item) for item in catalogue.custom_items),
+        ]
 
-    def _upsert_item(self, doc_id: str, text: str, metadata: dict) -> None:
-        """Upsert a single item."""
-        vector = embed(text)
-        point_id = string_to_uuid(doc_id)
+        # One upsert per chunk instead of one per item
+        for start in range(0, len(items), UPSERT_BATCH_SIZE):
+            self._upsert_items(items[start:start + UPSERT_BATCH_SIZE])
+
+        return len(items)
+
+    def _upsert_items(self, items: list[tuple[str, str, dict]]) -> None:
+        """Embed and upsert (doc_id, text, metadata) items in a single request."""
+        vectors = embed_batch([text for _, text, _ in items])
         self.client.upsert(
             collection_name=self.collection_name,
             points=[
                 PointStruct(
-                    id=point_id,
+                    id=string_to_uuid(doc_id),
                     vector=vector,
                     payload={
                         "doc_id": doc_id,  # Store original ID for retrieval
@@ -188,103 +160,123 @@ class QdrantCatalogueStore:
                         "text": text,
                     },
                 )
+                for (doc_id, text, metadata), vector in zip(items, vectors)
             ],
         )
 
+    def _upsert_item(self, doc_id: str, text: str, metadata: dict) -> None:
+        """Upsert a single item."""
+        self._upsert_items([(doc_id, text, metadata)])
+
     def _add_arch_note(self, project_id: str, note: ArchitecturalNote) -> None:
-        doc_id = self._make_id(project_id, "arch", note.title)
-        text = self._arch_note_to_text(note)
+        self._upsert_item(*self._build_arch_note(project_id, note))
+
+    def _add_security_note(self, project_id: str, note: SecurityNote) -> None:
+        self._upsert_item(*self._build_security_note(project_id, note))
+
+    def _add_dependency(self, project_id: str, dep: Dependency, dep_type: str) -> None:
+        self._upsert_item(*self._build_dependency(project_id, dep, dep_type))
 
-        self._upsert_item(doc_id, text, {
+    def _add_convention(self, project_id: str, conv: Convention) -> None:
+        self._upsert_item(*self._build_convention(project_id, conv))
+
+    def _add_file_coupling(self, project_id: str, coupling: FileCoupling) -> None:
+        self._upsert_item(*self._build_file_coupling(project_id, coupling))
+
+    def _add_decision(self, project_id: str, dec: Decision) -> None:
+        self._upsert_item(*self._build_decision(project_id, dec))
+
+    def _add_error_pattern(self, project_id: str, err: ErrorPattern) -> None:
+        self._upsert_item(*self._build_error_pattern(project_id, err))
+
+    def _add_custom_item(self, project_id: str, item: GenericCatalogueItem) -> None:
+        """Add a custom/flexible catalogue item to the vector store."""
+        self._upsert_item(*self._build_custom_item(project_id, item))
+
+    # Item builders: (doc_id, searchable text, payload metadata)
+    def _build_arch_note(self, project_id: str, note: ArchitecturalNote) -> tuple[str, str, dict]:
+        doc_id = self._make_id(project_id, "arch", note.title)
+        return doc_id, self._arch_note_to_text(note), {
             "project_id": project_id,
             "item_type": "arch",
             "title": note.title,
             "category": note.category,
             "related_files": ",".join(note.related_files),
-        })
+        }
 
-    def _add_security_note(self, project_id: str, note: SecurityNote) -> None:
+    def _build_security_note(self, project_id: str, note: SecurityNote) -> tuple[str, str, dict]:
         doc_id = self._make_id(project_id, "security", note.title)
-        text = self._security_note_to_text(note)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._security_note_to_text(note), {
             "project_id": project_id,
             "item_type": "security",
             "title": note.title,
             "severity": note.severity,
             "status": note.status,
-        })
+        }
 
-    def _add_dependency(self, project_id: str, dep: Dependency, dep_type: str) -> None:
+    def _build_dependency(
+        self, project_id: str, dep: Dependency, dep_type: str
+    ) -> tuple[str, str, dict]:
         doc_id = self._make_id(project_id, dep_type, dep.name)
-        text = self._dependency_to_text(dep, dep_type)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._dependency_to_text(dep, dep_type), {
             "project_id": project_id,
             "item_type": dep_type,
             "name": dep.name,
             "version": dep.version or "",
             "purpose": dep.purpose,
-        })
+        }
 
-    def _add_convention(self, project_id: str, conv: Convention) -> None:
+    def _build_convention(self, project_id: str, conv: Convention) -> tuple[str, str, dict]:
         doc_id = self._make_id(project_id, "convention", conv.title)
-        text = self._convention_to_text(conv)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._convention_to_text(conv), {
             "project_id": project_id,
             "item_type": "convention",
             "title": conv.title,
             "category": conv.category,
-        })
+        }
 
-    def _add_file_coupling(self, project_id: str, coupling: FileCoupling) -> None:
+    def _build_file_coupling(
+        self, project_id: str, coupling: FileCoupling
+    ) -> tuple[str, str, dict]:
         # Use first file as identifier
         identifier = coupling.files[0] if coupling.files else "unknown"
         doc_id = self._make_id(project_id, "coupling", identifier)
-        text = self._file_coupling_to_text(coupling)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._file_coupling_to_text(coupling), {
             "project_id": project_id,
             "item_type": "coupling",
             "files": ",".join(coupling.files),
             "direction": coupling.direction,
-        })
+        }
 
-    def _add_decision(self, project_id: str, dec: Decision) -> None:
+    def _build_decision(self, project_id: str, dec: Decision) -> tuple[str, str, dict]:
         doc_id = self._make_id(project_id, "decision", dec.title)
-        text = self._decision_to_text(dec)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._decision_to_text(dec), {
             "project_id": project_id,
             "item_type": "decision",
             "title": dec.title,
-        })
+        }
 
-    def _add_error_pattern(self, project_id: str, err: ErrorPattern) -> None:
+    def _build_error_pattern(self, project_id: str, err: ErrorPattern) -> tuple[str, str, dict]:
         # Use first 30 chars of error signature as identifier
         identifier = err.error_signature[:30]
         doc_id = self._make_id(project_id, "error", identifier)
-        text = self._error_pattern_to_text(err)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._error_pattern_to_text(err), {
             "project_id": project_id,
             "item_type": "error",
             "error_signature": err.error_signature[:100],
             "related_files": ",".join(err.related_files),
-        })
+        }
 
-    def _add_custom_item(self, project_id: str, item: GenericCatalogueItem) -> None:
-        """Add a custom/flexible catalogue item to the vector store."""
+    def _build_custom_item(
+        self, project_id: str, item: GenericCatalogueItem
+    ) -> tuple[str, str, dict]:
         doc_id = self._make_id(project_id, item.item_type, item.title)
-        text = self._custom_item_to_text(item)
-
-        self._upsert_item(doc_id, text, {
+        return doc_id, self._custom_item_to_text(item), {
             "project_id": project_id,
             "item_type": item.item_type,
             "title": item.title,
             "tags": ",".join(item.tags),
-        })
+        }
 
     def _custom_item_to_text(self, item: GenericCatalogueItem) -> str:
         """Convert a custom catalogue item to searchable text."""
@@ -319,30 +311,15 @@ class QdrantCatalogueStore:
 
     def remove_project(self, project_id: str) -> None:
         """Remove all items for a project."""
-        # Query for all items with this project_id
-        offset = None
-        ids_to_delete = []
-
-        while True:
-            result, offset = self.client.scroll(
-                collection_name=self.collection_name,
-                scroll_filter=Filter(
+        # Delete by filter so Qdrant finds the points itself, in one request
+        self.client.delete(
+            collection_name=self.collection_name,
+            points_selector=FilterSelector(
+                filter=Filter(
                     must=[FieldCondition(key="project_id", match=MatchValue(value=project_id))]
-                ),
-                limit=1000,
-                offset=offset,
-                with_payload=False,
-                with_vectors=False,
-            )
-            ids_to_delete.extend(p.id for p in result)
-            if offset is None:
-                break
-
-        if ids_to_delete:
-            self.client.delete(
-                collection_name=self.collection_name,
-                points_selector=ids_to_delete,
-            )
+                )
+            ),
+        )
 
     def search(
         self,
@@ -398,24 +375,14 @@ class QdrantCatalogueStore:
     def count(self, project_id: str | None = None) -> int:
         """Get count of items, optionally filtered by project."""
         if project_id:
-            # Count items for specific project
-            offset = None
-            count = 0
-            while True:
-                result, offset = self.client.scroll(
-                    collection_name=self.collection_name,
-                    scroll_filter=Filter(
-                        must=[FieldCondition(key="project_id", match=MatchValue(value=project_id))]
-                    ),
-                    limit=1000,
-                    offset=offset,
-                    with_payload=False,
-                    with_vectors=False,
-                )
-                count += len(result)
-                if offset is None:
-                    break
-            return count
+            # Qdrant counts server-side; no ids are shipped back
+            return self.client.count(
+                collection_name=self.collection_name,
+                count_filter=Filter(
+                    must=[FieldCondition(key="project_id", match=MatchValue(value=project_id))]
+                ),
+                exact=True,
+            ).count
 
         info = self.client.get_collection(self.collection_name)
         return info.points_count
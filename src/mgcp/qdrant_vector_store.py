@@ -25,10 +25,11 @@ from qdrant_client.models import (
     Filter,
     MatchValue,
     PointStruct,
+    QueryRequest,
     VectorParams,
 )
 
-from .embedding import EMBEDDING_DIMENSION, embed, embed_batch, embed_query
+from .embedding import EMBEDDING_DIMENSION, embed, embed_batch, embed_query, embed_query_batch
 from .models import Lesson
 
 logger = logging.getLogger("mgcp.qdrant_vector_store")
@@ -101,34 +102,48 @@ class QdrantVectorStore:
     def add_lesson(self, lesson: Lesson) -> None:
         """Add or update a lesson in the vector store."""
         text = self._lesson_to_text(lesson)
-        vector = embed(text)
-        point_id = string_to_uuid(lesson.id)
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=[self._lesson_point(lesson, text, embed(text))],
+        )
+
+    def add_lessons(self, lessons: list[Lesson]) -> None:
+        """Add or update many lessons: one embedding batch, one upsert."""
+        if not lessons:
+            return
 
+        texts = [self._lesson_to_text(lesson) for lesson in lessons]
+        vectors = embed_batch(texts)
         self.client.upsert(
             collection_name=self.collection_name,
             points=[
-                PointStruct(
-                    id=point_id,
-                    vector=vector,
-                    payload={
-                        "lesson_id": lesson.id,  # Store original ID for retrieval
-                        "trigger": lesson.trigger,
-                        "action": lesson.action,
-                        # A LIST, not a joined string. Qdrant's MatchValue is exact
-                        # equality on the whole field, so a payload of
-                        # "git,commits,workflow" could never match a filter for "git".
-                        # Every tag-filtered search in this system's history returned
-                        # empty, unnoticed because no shipped caller passed `tags`.
-                        # On a list payload MatchValue matches if any element equals.
-                        "tags": list(lesson.tags),
-                        "parent_id": lesson.parent_id or "",
-                        "usage_count": lesson.usage_count,
-                        "text": text,  # Store for similarity search
-                    },
-                )
+                self._lesson_point(lesson, text, vector)
+                for lesson, text, vector in zip(lessons, texts, vectors)
             ],
         )
 
+    def _lesson_point(self, lesson: Lesson, text: str, vector: list[float]) -> PointStruct:
+        """Build the Qdrant point stored for a lesson."""
+        return PointStruct(
+            id=string_to_uuid(lesson.id),
+            vector=vector,
+            payload={
+                "lesson_id": lesson.id,  # Store original ID for retrieval
+                "trigger": lesson.trigger,
+                "action": lesson.action,
+                # A LIST, not a joined string. Qdrant's MatchValue is exact
+                # equality on the whole field, so a payload of
+                # "git,commits,workflow" could never match a filter for "git".
+                # Every tag-filtered search in this system's history returned
+                # empty, unnoticed because no shipped caller passed `tags`.
+                # On a list payload MatchValue matches if any element equals.
+                "tags": list(lesson.tags),
+                "parent_id": lesson.parent_id or "",
+                "usage_count": lesson.usage_count,
+                "text": text,  # Store for similarity search
+            },
+        )
+
     def remove_vector_lesson(self, lesson_id: str) -> bool:
         """Remove a lesson from the vector store.
 
@@ -278,6 +293,39 @@ class QdrantVectorStore:
 
         return matches
 
+    def search_batch(
+        self,
+        queries: list[str],
+        limit: int = 5,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> list[list[tuple[str, float]]]:
+        """Run several searches at once: one embedding batch, one Qdrant request.
+
+        Returns:
+            One list of (lesson_id, score) tuples per query, in query order,
+            each as search() would return it
+        """
+        if not queries:
+            return []
+
+        query_vectors = embed_query_batch(queries)
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                QueryRequest(query=vector, limit=limit, with_payload=["lesson_id"])
+                for vector in query_vectors
+            ],
+        )
+
+        return [
+            [
+                (point.payload.get("lesson_id", str(point.id)), point.score)
+                for point in response.points
+                if point.score >= min_score
+            ]
+            for response in responses
+        ]
+
     def search_similar(
         self,
         lesson_id: str,
@@ -367,35 +415,7 @@ class QdrantVectorStore:
 
         self._ensure_collection()
 
-        # Batch add all lessons
-        if not lessons:
-            return
-
-        texts = [self._lesson_to_text(lesson) for lesson in lessons]
-        vectors = embed_batch(texts)
-
-        points = [
-            PointStruct(
-                id=string_to_uuid(lesson.id),
-                vector=vector,
-                payload={
-                    "lesson_id": lesson.id,  # Store original ID for retrieval
-                    "trigger": lesson.trigger,
-                    "action": lesson.action,
-                    "tags": list(lesson.tags),  # list, not joined — see add_lesson
-                    "parent_id": lesson.parent_id or "",
-                    "usage_count": lesson.usage_count,
-                    "text": texts[i],
-                },
-            )
-            for i, (lesson, vector) in enumerate(zip(lessons, vectors))
-        ]
-
-        # Batch upsert
-        self.client.upsert(
-            collection_name=self.collection_name,
-            points=points,
-        )
+        self.add_lessons(lessons)
 
     # Workflow collection support (moved from server.py direct access)
     def get_or_create_workflow_collection(self) -> str:
@@ -440,6 +460,46 @@ class QdrantVectorStore:
             ],
         )
 
+    def sync_workflows(self, workflows: list[tuple[str, str, dict]]) -> int:
+        """Upsert only the workflows whose stored text or metadata has changed.
+
+        Args:
+            workflows: (workflow_id, searchable_text, metadata) tuples
+
+        Returns:
+            Number of workflows re-embedded
+        """
+        collection = self.get_or_create_workflow_collection()
+        if not workflows:
+            return 0
+
+        existing = self.client.retrieve(
+            collection_name=collection,
+            ids=[string_to_uuid(workflow_id) for workflow_id, _, _ in workflows],
+            with_payload=True,
+            with_vectors=False,
+        )
+        stored = {p.payload.get("workflow_id"): p.payload for p in existing if p.payload}
+
+        pending = []
+        for workflow_id, searchable_text, metadata in workflows:
+            payload = {"workflow_id": workflow_id, **metadata, "text": searchable_text}
+            if stored.get(workflow_id) != payload:
+                pending.append((workflow_id, payload))
+
+        if not pending:
+            return 0
+
+        vectors = embed_batch([payload["text"] for _, payload in pending])
+        self.client.upsert(
+            collection_name=collection,
+            points=[
+                PointStruct(id=string_to_uuid(workflow_id), vector=vector, payload=payload)
+                for (workflow_id, payload), vector in zip(pending, vectors)
+            ],
+        )
+        return len(pending)
+
     def query_workflows(self, query: str, limit: int = 10) -> list[tuple[str, float, dict]]:
         """Query workflows by semantic similarity.
 
@@ -6,6 +6,7 @@ https://github.com/modelcontextprotocol/python-sdk
 """
 
 import asyncio
+import bisect
 import json
 import os
 import re
@@ -319,7 +320,7 @@ async def spider_lessons(lesson_id: str, depth: int = 2) -> str:
 
     depth = min(depth, 5)  # Cap depth
 
-    if lesson_id not in [n for n in graph.graph.nodes()]:
+    if lesson_id not in graph.graph:
         return f"Lesson not found in graph: {lesson_id}"
 
     visited_ids, paths = graph.spider(lesson_id, depth=depth)
@@ -1347,19 +1348,21 @@ async def query_workflows(task_description: str, min_relevance: float = 0.35) ->
     if not workflows:
         return "No workflows available."
 
-    # Index/update workflows in Qdrant
-    for wf in workflows:
-        searchable_text = f"{wf.name}. {wf.description}. Keywords: {wf.trigger}"
-        vector_store.upsert_workflow(
-            workflow_id=wf.id,
-            searchable_text=searchable_text,
-            metadata={
+    # Index/update workflows in Qdrant. Unchanged workflows are skipped, so a
+    # typical query embeds nothing but the task description.
+    vector_store.sync_workflows([
+        (
+            wf.id,
+            f"{wf.name}. {wf.description}. Keywords: {wf.trigger}",
+            {
                 "name": wf.name,
                 "description": wf.description,
                 "trigger": wf.trigger,
                 "step_count": len(wf.steps),
             },
         )
+        for wf in workflows
+    ])
 
     # Query for matching workflows
     results = vector_store.query_workflows(task_description, limit=len(workflows))
@@ -1532,7 +1535,8 @@ async def link_lesson_to_workflow_step(
         relevance=relevance,
         priority=min(max(priority, 1), 3),
     )
-    step.lessons.append(link)
+    # Keep links in priority order; ties stay in the order they were linked
+    bisect.insort(step.lessons, link, key=lambda l: l.priority)
 
     await store.save_workflow(workflow)
 
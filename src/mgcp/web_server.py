@@ -220,6 +220,9 @@ async def get_graph_data() -> dict[str, Any]:
     await ensure_initialized()
 
     lessons = await store.get_all_lessons()
+    # Every parent a lesson can point at is already in this list, so resolve
+    # category nodes from it instead of one get_lesson round-trip per category.
+    lessons_by_id = {lesson.id: lesson for lesson in lessons}
     usage_data = await telemetry.get_lesson_usage() if telemetry else []
     usage_map = {u["lesson_id"]: u["total_retrievals"] for u in usage_data}
 
@@ -243,7 +246,7 @@ async def get_graph_data() -> dict[str, Any]:
     for lesson in lessons:
         # Add category node if lesson has a parent
         if lesson.parent_id and lesson.parent_id not in categories:
-            parent_lesson = await store.get_lesson(lesson.parent_id)
+            parent_lesson = lessons_by_id.get(lesson.parent_id)
             if parent_lesson:
                 parent_usage = usage_map.get(lesson.parent_id, 0)
                 nodes.append({
@@ -8,9 +8,13 @@ endpoint was broken but unit tests didn't catch it.
 Run with: pytest tests/test_api_ui_integration.py -v
 """
 
+import asyncio
+
 import pytest
 from fastapi.testclient import TestClient
 
+from src.mgcp.models import Lesson
+from src.mgcp.persistence import LessonStore
 from src.mgcp.web_server import app
 
 
@@ -118,6 +122,34 @@ class TestLessonCRUD:
             assert data is not None
             assert data["id"] == lesson_id
 
+    def test_graph_categories_hang_off_root(self, client):
+        """A parent lesson becomes a category node linked to root."""
+        store = LessonStore()
+        parent = Lesson(id="graph-test-parent", trigger="Foo, bar", action="Parent action")
+        child = Lesson(
+            id="graph-test-child", trigger="child", action="Child action", parent_id=parent.id
+        )
+        asyncio.run(store.add_lesson(parent))
+        asyncio.run(store.add_lesson(child))
+        try:
+            response = client.get("/api/graph")
+        finally:
+            asyncio.run(store.delete_lesson(child.id))
+            asyncio.run(store.delete_lesson(parent.id))
+
+        assert response.status_code == 200
+        data = response.json()
+
+        # The category node built for the child's parent (the parent's own
+        # lesson node carries a trigger; the category node does not)
+        category = next(n for n in data["nodes"] if n["id"] == parent.id and "trigger" not in n)
+        assert category["type"] == "category"
+        assert category["parent"] == "root"
+        assert category["label"] == "Foo"
+        assert category["action"] == parent.action
+        # The category link, not the relation-tagged one parentless lessons get
+        assert {"source": "root", "target": parent.id} in data["links"]
+
 
 class TestCatalogueOperations:
     """Test catalogue operations."""
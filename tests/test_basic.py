@@ -83,6 +83,18 @@ class TestLessonStore:
         result = await store.get_lesson("nonexistent")
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_lessons_by_ids(self, temp_db, sample_lesson):
+        """Test bulk lookup skips unknown IDs."""
+        store = LessonStore(db_path=temp_db)
+        await store.add_lesson(sample_lesson)
+        await store.add_lesson(Lesson(id="other", trigger="other", action="Other"))
+
+        found = await store.get_lessons_by_ids(["test-lesson", "other", "missing"])
+        assert set(found) == {"test-lesson", "other"}
+        assert found["other"].action == "Other"
+        assert await store.get_lessons_by_ids([]) == {}
+
     @pytest.mark.asyncio
     async def test_record_usage(self, temp_db, sample_lesson):
         """Test recording lesson usage."""
@@ -213,6 +225,65 @@ class TestQdrantVectorStore:
         assert "new-2" in store.get_all_ids()
 
 
+class TestEmbedding:
+    """Test embedding helpers without loading the real model."""
+
+    def test_embed_query_memoised(self, monkeypatch):
+        """Repeated queries hit the model once and return independent lists."""
+        import numpy as np
+
+        from mgcp import embedding
+
+        calls = []
+
+        class FakeModel:
+            def encode(self, text, normalize_embeddings=True):
+                calls.append(text)
+                return np.array([0.6, 0.8], dtype=np.float32)
+
+        monkeypatch.setattr(embedding, "get_embedding_model", lambda: FakeModel())
+        embedding._embed_query_cached.cache_clear()
+        try:
+            first = embedding.embed_query("how do I test?")
+            first.append(1.0)
+            second = embedding.embed_query("how do I test?")
+            # The cached array itself can't be modified in place
+            cached = embedding._embed_query_cached("how do I test?")
+        finally:
+            embedding._embed_query_cached.cache_clear()
+
+        assert second == pytest.approx([0.6, 0.8])
+        assert calls == [embedding.QUERY_INSTRUCTION + "how do I test?"]
+        assert not cached.flags.writeable
+
+    def test_embed_batch_size_follows_device(self, monkeypatch):
+        """embed_batch picks a device-appropriate batch size unless told otherwise."""
+        from types import SimpleNamespace
+
+        import numpy as np
+
+        from mgcp import embedding
+
+        batch_sizes = []
+
+        class FakeModel:
+            device = SimpleNamespace(type="cpu")
+
+            def encode(self, texts, batch_size, **kwargs):
+                batch_sizes.append(batch_size)
+                return np.zeros((len(texts), 2))
+
+        model = FakeModel()
+        monkeypatch.setattr(embedding, "get_embedding_model", lambda: model)
+
+        assert embedding.embed_batch(["a", "b"]) == [[0.0, 0.0], [0.0, 0.0]]
+        model.device = SimpleNamespace(type="cuda")
+        embedding.embed_batch(["a"])
+        embedding.embed_batch(["a"], batch_size=4)
+
+        assert batch_sizes == [embedding.CPU_BATCH_SIZE, embedding.GPU_BATCH_SIZE, 4]
+
+
 class TestTypedRelationships:
     """Test typed relationship functionality."""
 
@@ -0,0 +1,139 @@
+"""Tests for loading bootstrap lessons, workflows and relationships from YAML."""
+
+import yaml
+
+from mgcp import bootstrap_loader
+from mgcp.bootstrap_loader import (
+    BOOTSTRAP_DIR,
+    _classify,
+    _collect_yaml_files,
+    _load_yaml_file,
+    find_dangling_references,
+    load_all,
+    load_lessons,
+    load_relationships,
+    load_workflows,
+)
+
+
+class TestYamlParsing:
+    """The fast loader must read the shipped YAML exactly like PyYAML's safe_load."""
+
+    def test_matches_pure_python_loader(self):
+        paths = _collect_yaml_files(BOOTSTRAP_DIR)
+        assert paths
+
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                expected = yaml.safe_load(f) or {}
+            assert _load_yaml_file(path) == expected, path
+
+    def test_pure_python_loader_decodes_bytes(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(bootstrap_loader, "_SafeLoader", yaml.SafeLoader)
+        path = tmp_path / "lessons.yaml"
+        path.write_text("lessons:\n  - id: café\n    trigger: ünïcode\n", encoding="utf-8")
+
+        assert _load_yaml_file(path) == {"lessons": [{"id": "café", "trigger": "ünïcode"}]}
+
+    def test_empty_file_is_empty_dict(self, tmp_path):
+        path = tmp_path / "empty.yaml"
+        path.write_text("")
+        assert _load_yaml_file(path) == {}
+
+
+class TestLoadAll:
+    """load_all returns what the per-kind loaders return, from one walk."""
+
+    def test_matches_per_kind_loaders(self):
+        for subdir in (None, "core", "dev"):
+            lessons, relationships, workflows = load_all(subdir)
+            assert [l.id for l in lessons] == [l.id for l in load_lessons(subdir)]
+            assert relationships == load_relationships(subdir)
+            assert [w.id for w in workflows] == [w.id for w in load_workflows(subdir)]
+
+    def test_dispatches_by_file_name(self, monkeypatch, tmp_path):
+        (tmp_path / "lessons.yaml").write_text("lessons:\n  - {id: a, trigger: t, action: x}\n")
+        (tmp_path / "relationships.yaml").write_text(
+            "relationships:\n  - {source: a, target: b, type: related}\n"
+        )
+        (tmp_path / "workflows.yaml").write_text(
+            "workflows:\n  - {id: wf, name: W, description: D, trigger: t}\n"
+        )
+        monkeypatch.setattr(bootstrap_loader, "BOOTSTRAP_DIR", tmp_path)
+
+        lessons, relationships, workflows = load_all()
+        assert [l.id for l in lessons] == ["a"]
+        assert relationships == [("a", "b", "related", "")]
+        assert [w.id for w in workflows] == ["wf"]
+
+    def test_classify(self, tmp_path):
+        assert _classify(tmp_path / "relationships.yaml") == "relationships"
+        assert _classify(tmp_path / "security-relationships.yaml") == "relationships"
+        assert _classify(tmp_path / "workflows.yaml") == "workflows"
+        assert _classify(tmp_path / "testing.yaml") == "lessons"
+
+    def test_yaml_parsed_once_and_models_fresh(self, monkeypatch, tmp_path):
+        (tmp_path / "lessons.yaml").write_text(
+            "lessons:\n  - {id: a, trigger: t, action: x, tags: [one]}\n"
+        )
+        monkeypatch.setattr(bootstrap_loader, "BOOTSTRAP_DIR", tmp_path)
+        reads = []
+        real_load = bootstrap_loader._load_yaml_file
+        monkeypatch.setattr(
+            bootstrap_loader, "_load_yaml_file", lambda p: reads.append(p) or real_load(p)
+        )
+
+        first = load_lessons()
+        first[0].tags.append("mutated")
+        second = load_lessons()
+
+        assert len(reads) == 1
+        assert second[0].tags == ["one"]
+        assert second[0] is not first[0]
+
+    def test_step_lessons_sorted_by_priority(self, monkeypatch, tmp_path):
+        (tmp_path / "workflows.yaml").write_text(
+            "workflows:\n"
+            "  - id: wf\n"
+            "    name: W\n"
+            "    description: D\n"
+            "    trigger: t\n"
+            "    steps:\n"
+            "      - id: s\n"
+            "        name: S\n"
+            "        description: D\n"
+            "        order: 1\n"
+            "        lessons:\n"
+            "          - {lesson_id: helpful, relevance: r, priority: 3}\n"
+            "          - {lesson_id: important-a, relevance: r}\n"
+            "          - {lesson_id: critical, relevance: r, priority: 1}\n"
+            "          - {lesson_id: important-b, relevance: r, priority: 2}\n"
+        )
+        monkeypatch.setattr(bootstrap_loader, "BOOTSTRAP_DIR", tmp_path)
+
+        [workflow] = load_workflows()
+
+        # Ties (both priority 2) keep their authoring order
+        assert [link.lesson_id for link in workflow.steps[0].lessons] == [
+            "critical", "important-a", "important-b", "helpful",
+        ]
+
+    def test_shipped_step_lessons_in_priority_order(self):
+        for workflow in load_workflows():
+            for step in workflow.steps:
+                priorities = [link.priority for link in step.lessons]
+                assert priorities == sorted(priorities), (workflow.id, step.id)
+
+
+class TestReferences:
+    """Every id the bootstrap data refers to must be defined somewhere in it."""
+
+    def test_shipped_data_has_no_dangling_references(self):
+        assert find_dangling_references(*load_all()) == []
+
+    def test_reports_unknown_ids(self):
+        lessons, _, _ = load_all("core")
+        problems = find_dangling_references(lessons, [(lessons[0].id, "no-such-lesson", "related", "")], [])
+        assert problems == [
+            f"relationship {lessons[0].id} --[related]--> no-such-lesson: unknown lesson no-such-lesson"
+        ]
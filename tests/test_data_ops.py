@@ -1,6 +1,8 @@
 """Tests for data operations - export, import, duplicates."""
 
 import json
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -293,6 +295,12 @@ class TestExportProjects:
         assert len(proj_1["todos"]) == 2
         assert proj_1["todos"][0]["content"] == "Fix bug"
 
+    def test_export_does_not_import_vector_store(self):
+        """The export CLIs start without loading qdrant_client."""
+        code = "import sys, mgcp.data_ops; print('qdrant_client' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "False"
+
 
 # =============================================================================
 # Import Tests
@@ -321,7 +329,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=[])
@@ -336,6 +344,10 @@ class TestImportLessons:
         assert result["total"] == 1
         assert result["imported"] == 1
         assert result["skipped"] == 0
+        # Imported lessons are indexed in one batch, not one at a time
+        mock_vector.add_lessons.assert_called_once()
+        assert [l.id for l in mock_vector.add_lessons.call_args.args[0]] == ["new-lesson"]
+        assert not mock_vector.add_lesson.called
 
     @pytest.mark.asyncio
     async def test_import_skip_duplicates(self, temp_dir, sample_lessons):
@@ -350,7 +362,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
@@ -375,7 +387,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
@@ -402,7 +414,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
@@ -428,7 +440,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=[])
@@ -462,7 +474,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=[])
@@ -488,7 +500,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=[])
@@ -520,7 +532,7 @@ class TestImportLessons:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
@@ -545,7 +557,7 @@ class TestFindDuplicates:
         """Test that duplicates are returned as pairs."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
@@ -553,8 +565,10 @@ class TestFindDuplicates:
 
             # Mock vector store to return similar lessons
             mock_vector = MagicMock()
-            mock_vector.search = MagicMock(
-                return_value=[("lesson-1", 0.95), ("lesson-2", 0.90)]
+            mock_vector.search_batch = MagicMock(
+                side_effect=lambda queries, **kw: [
+                    [("lesson-1", 0.95), ("lesson-2", 0.90)] for _ in queries
+                ]
             )
             MockVector.return_value = mock_vector
 
@@ -571,15 +585,17 @@ class TestFindDuplicates:
         """Test that threshold filtering works."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
             MockStore.return_value = mock_store
 
             mock_vector = MagicMock()
-            mock_vector.search = MagicMock(
-                return_value=[("lesson-2", 0.80)]  # Below threshold
+            mock_vector.search_batch = MagicMock(
+                side_effect=lambda queries, **kw: [
+                    [("lesson-2", 0.80)] for _ in queries  # Below threshold
+                ]
             )
             MockVector.return_value = mock_vector
 
@@ -593,7 +609,7 @@ class TestFindDuplicates:
         """Test that a lesson doesn't match itself."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons[:1])
@@ -601,7 +617,7 @@ class TestFindDuplicates:
 
             mock_vector = MagicMock()
             # Only returns itself
-            mock_vector.search = MagicMock(return_value=[("lesson-1", 1.0)])
+            mock_vector.search_batch = MagicMock(return_value=[[("lesson-1", 1.0)]])
             MockVector.return_value = mock_vector
 
             duplicates = await find_duplicates()
@@ -613,7 +629,7 @@ class TestFindDuplicates:
         """Test that results are sorted by similarity descending."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=sample_lessons)
@@ -625,11 +641,17 @@ class TestFindDuplicates:
                 return []
 
             mock_vector = MagicMock()
-            mock_vector.search = MagicMock(side_effect=mock_search)
+            mock_vector.search_batch = MagicMock(
+                side_effect=lambda queries, **kw: [mock_search(q, **kw) for q in queries]
+            )
             MockVector.return_value = mock_vector
 
             duplicates = await find_duplicates(threshold=0.85)
 
+        # Every lesson is searched in a single batched call
+        mock_vector.search_batch.assert_called_once()
+        assert not mock_vector.search.called
+
         if len(duplicates) >= 2:
             assert duplicates[0]["similarity"] >= duplicates[1]["similarity"]
 
@@ -647,7 +669,7 @@ class TestSuggestTags:
         """Test that tags are suggested from similar lessons."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_lesson = AsyncMock(
@@ -655,6 +677,9 @@ class TestSuggestTags:
                     (l for l in sample_lessons if l.id == id), None
                 )
             )
+            mock_store.get_lessons_by_ids = AsyncMock(
+                side_effect=lambda ids: {l.id: l for l in sample_lessons if l.id in ids}
+            )
             MockStore.return_value = mock_store
 
             mock_vector = MagicMock()
@@ -666,13 +691,17 @@ class TestSuggestTags:
             suggestions = await suggest_tags("lesson-1", max_tags=5)
 
         assert isinstance(suggestions, list)
+        # Similar lessons are fetched in one bulk lookup, not one query each
+        mock_store.get_lessons_by_ids.assert_awaited_once_with(["lesson-2", "lesson-3"])
+        assert mock_store.get_lesson.await_count == 1
+        assert set(suggestions) == {"errors", "exceptions", "testing", "pytest"}
 
     @pytest.mark.asyncio
     async def test_suggest_tags_excludes_existing(self, sample_lessons):
         """Test that existing tags are not suggested."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_lesson = AsyncMock(
@@ -680,6 +709,9 @@ class TestSuggestTags:
                     (l for l in sample_lessons if l.id == id), None
                 )
             )
+            mock_store.get_lessons_by_ids = AsyncMock(
+                side_effect=lambda ids: {l.id: l for l in sample_lessons if l.id in ids}
+            )
             MockStore.return_value = mock_store
 
             mock_vector = MagicMock()
@@ -696,10 +728,13 @@ class TestSuggestTags:
         """Test that max_tags limit is respected."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_lesson = AsyncMock(return_value=sample_lessons[0])
+            mock_store.get_lessons_by_ids = AsyncMock(
+                side_effect=lambda ids: {id: sample_lessons[0] for id in ids}
+            )
             MockStore.return_value = mock_store
 
             mock_vector = MagicMock()
@@ -717,7 +752,7 @@ class TestSuggestTags:
         """Test handling of non-existent lesson."""
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore"),
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore"),
         ):
             mock_store = MagicMock()
             mock_store.get_lesson = AsyncMock(return_value=None)
@@ -767,7 +802,7 @@ class TestDataOpsEdgeCases:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=[])
@@ -801,7 +836,7 @@ class TestDataOpsEdgeCases:
 
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             mock_store = MagicMock()
             mock_store.get_all_lessons = AsyncMock(return_value=[])
@@ -866,11 +901,11 @@ class TestDataOpsRegressions:
     @pytest.mark.asyncio
     async def test_vector_search_returns_tuples(self):
         """
-        Regression: VectorStore.search() returns (id, score) tuples, not dicts.
+        Regression: VectorStore.search_batch() returns (id, score) tuples, not dicts.
         """
         with (
             patch("mgcp.data_ops.LessonStore") as MockStore,
-            patch("mgcp.data_ops.QdrantVectorStore") as MockVector,
+            patch("mgcp.qdrant_vector_store.QdrantVectorStore") as MockVector,
         ):
             lesson = Lesson(id="test", trigger="test", action="test")
             mock_store = MagicMock()
@@ -879,7 +914,7 @@ class TestDataOpsRegressions:
 
             # Correct return format: list of (id, score) tuples
             mock_vector = MagicMock()
-            mock_vector.search = MagicMock(return_value=[("other-lesson", 0.90)])
+            mock_vector.search_batch = MagicMock(return_value=[[("other-lesson", 0.90)]])
             MockVector.return_value = mock_vector
 
             # This should not raise TypeError
@@ -311,6 +311,15 @@ class TestGraphTraversal:
         related = populated_graph.get_related("grandchild-1")
         assert "child-2" in related
 
+    def test_depths_match_per_node_walk(self, populated_graph):
+        """Whole-graph depth views agree with the per-node ancestor walk."""
+        nodes = {n["id"]: n for n in populated_graph.to_dict()["nodes"]}
+
+        for node_id, node in nodes.items():
+            assert node["depth"] == populated_graph.get_hierarchy_depth(node_id)
+        assert nodes["grandchild-1"]["depth"] == 2
+        assert populated_graph.get_statistics()["max_depth"] == 2
+
 
 class TestExportImportIntegration:
     """Integration tests for export/import workflows."""
@@ -83,7 +83,8 @@ def mock_embeddings(monkeypatch):
     monkeypatch.setattr("mgcp.qdrant_vector_store.embed", _mock_embed)
     monkeypatch.setattr("mgcp.qdrant_vector_store.embed_query", _mock_embed)
     monkeypatch.setattr("mgcp.qdrant_vector_store.embed_batch", _mock_embed_batch)
-    monkeypatch.setattr("mgcp.qdrant_catalogue_store.embed", _mock_embed)
+    monkeypatch.setattr("mgcp.qdrant_vector_store.embed_query_batch", _mock_embed_batch)
+    monkeypatch.setattr("mgcp.qdrant_catalogue_store.embed_batch", _mock_embed_batch)
     monkeypatch.setattr("mgcp.qdrant_catalogue_store.embed_query", _mock_embed)
 
 
@@ -213,6 +214,38 @@ class TestQueryLessons:
         result = await query_lessons("topic", limit=2)
         assert "Found" in result
 
+    @pytest.mark.asyncio
+    async def test_search_batch_matches_search(self, server_stores):
+        for i in range(5):
+            await add_lesson(id=f"lesson-{i}", trigger=f"topic {i}", action=f"Do thing {i}")
+        vector_store = server_stores["vector_store"]
+        queries = ["topic 1", "thing 3", "unrelated"]
+
+        batched = vector_store.search_batch(queries, limit=5, min_score=0.0)
+
+        # Mock vectors are near-identical, so compare hits and scores, not
+        # the order of ties that differ only in float rounding
+        assert len(batched) == len(queries)
+        for query, hits in zip(queries, batched):
+            expected = dict(vector_store.search(query, limit=5, min_score=0.0))
+            assert dict(hits) == pytest.approx(expected)
+        assert vector_store.search_batch([]) == []
+
+    @pytest.mark.asyncio
+    async def test_add_lessons_matches_add_lesson(self, server_stores):
+        from mgcp.models import Lesson
+
+        vector_store = server_stores["vector_store"]
+        lessons = [Lesson(id=f"bulk-{i}", trigger=f"bulk {i}", action="x", tags=["t"]) for i in range(3)]
+        vector_store.add_lessons(lessons)
+        vector_store.add_lesson(Lesson(id="single", trigger="single", action="x", tags=["t"]))
+
+        points, _ = vector_store.client.scroll(vector_store.collection_name, with_payload=True)
+        payloads = {p.payload["lesson_id"]: p.payload for p in points}
+        assert set(payloads) == {"bulk-0", "bulk-1", "bulk-2", "single"}
+        assert payloads["bulk-0"].keys() == payloads["single"].keys()
+        assert payloads["bulk-0"]["tags"] == ["t"]
+
 
 class TestGetLesson:
     @pytest.mark.asyncio
@@ -955,6 +988,31 @@ class TestSearchCatalogue:
         assert "No matching" in result
 
 
+class TestIndexCatalogue:
+    def test_whole_catalogue_in_one_upsert(self, server_stores, monkeypatch):
+        from mgcp.models import ArchitecturalNote, Dependency, ProjectCatalogue
+
+        catalogue_vector = server_stores["catalogue_vector"]
+        catalogue = ProjectCatalogue(
+            architecture_notes=[
+                ArchitecturalNote(title="Auth", description="JWT auth", category="architecture")
+            ],
+            frameworks=[Dependency(name="FastAPI", purpose="web")],
+            libraries=[Dependency(name="pydantic", purpose="models")],
+        )
+        calls = []
+        real_upsert = catalogue_vector.client.upsert
+        monkeypatch.setattr(
+            catalogue_vector.client,
+            "upsert",
+            lambda **kw: calls.append(len(kw["points"])) or real_upsert(**kw),
+        )
+
+        assert catalogue_vector.index_catalogue("proj", catalogue) == 3
+        assert calls == [3]
+        assert catalogue_vector.count("proj") == 3
+
+
 # ============================================================================
 # WORKFLOW TOOLS
 # ============================================================================
@@ -1100,6 +1158,22 @@ class TestLinkLessonToWorkflowStep:
         )
         assert "Linked" in result
 
+    @pytest.mark.asyncio
+    async def test_links_kept_in_priority_order(self, server_stores, seeded_workflow):
+        for lesson_id, priority in [("helpful", 3), ("critical", 1), ("also-critical", 1)]:
+            await add_lesson(id=lesson_id, trigger=lesson_id, action=lesson_id)
+            await link_lesson_to_workflow_step(
+                workflow_id="test-workflow",
+                step_id="step-one",
+                lesson_id=lesson_id,
+                relevance="Ordering",
+                priority=priority,
+            )
+
+        workflow = await server_stores["store"].get_workflow("test-workflow")
+        links = workflow.get_step("step-one").lessons
+        assert [l.lesson_id for l in links] == ["critical", "also-critical", "helpful"]
+
     @pytest.mark.asyncio
     async def test_duplicate_link(self, seeded_workflow, seeded_lesson):
         await link_lesson_to_workflow_step(
@@ -1139,6 +1213,18 @@ class TestQueryWorkflows:
         result = await query_workflows("anything")
         assert "No workflows available" in result
 
+    @pytest.mark.asyncio
+    async def test_unchanged_workflows_not_reembedded(self, server_stores, seeded_workflow):
+        vector_store = server_stores["vector_store"]
+        await query_workflows("running unit tests")
+
+        meta = {"name": "Test Workflow", "description": "A test workflow",
+                "trigger": "test, unit test", "step_count": 2}
+        text = "Test Workflow. A test workflow. Keywords: test, unit test"
+        assert vector_store.sync_workflows([("test-workflow", text, meta)]) == 0
+        meta["step_count"] = 3
+        assert vector_store.sync_workflows([("test-workflow", text, meta)]) == 1
+
 
 # ============================================================================
 # COMMUNITY DETECTION TOOLS